@@ -1,19 +1,25 @@
 from fastapi import FastAPI, HTTPException, Depends, Security, Request
 from fastapi.security import APIKeyHeader, OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Dict, Any, Optional
-import csv
+from fastapi.responses import ORJSONResponse, Response
+from typing import List, Dict, Any, Optional, Callable, Tuple
 import os
-from azure.storage.blob import BlobServiceClient
+import orjson
+import pandas as pd
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceModifiedError
+from azure.storage.blob.aio import BlobServiceClient
+import asyncio
+import hashlib
+import hmac
 import io
 import logging
+import time
+from collections import deque
 from datetime import datetime, timedelta
+from cachetools import TTLCache
 from jose import JWTError, jwt
-from passlib.context import CryptContext
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 # Security configuration
 SECRET_KEY = os.getenv("SECRET_KEY")
@@ -21,16 +27,15 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 API_KEY = os.getenv("API_KEY")
 
+# Decoded tokens are cached briefly so repeat requests skip signature verification
+TOKEN_CACHE_TTL_SECONDS = 30
+_token_cache = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL_SECONDS)
+
 # Set up logging for debugging and monitoring
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Cramerton Development Tracker API")
-
-# Configure rate limiting
-limiter = Limiter(key_func=get_remote_address)
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+app = FastAPI(title="Cramerton Development Tracker API", default_response_class=ORJSONResponse)
 
 # Enable CORS for frontend communication
 app.add_middleware(
@@ -46,12 +51,30 @@ connection_string = os.getenv("AZURE_STORAGE_CONNECTION_STRING")
 container_name = os.getenv("AZURE_STORAGE_CONTAINER_NAME")
 blob_name = "Development_Status.csv"
 
+# Parsed CSV rows are cached in-process and revalidated against the blob ETag
+CACHE_TTL_SECONDS = 15
+MAX_SAVE_ATTEMPTS = 3
+CLIENT_CACHE_CONTROL = "private, max-age=10"
+_cache = {"etag": None, "df": None, "data": None, "index": {}, "json": None, "by_category_json": {}, "ts": 0, "generation": 0}
+_load_lock = asyncio.Lock()
+
+# Mutations are queued and written together once the flush delay has passed
+FLUSH_DELAY_SECONDS = 0.5
+_pending_mutations = []
+_flush_task = None
+_write_lock = asyncio.Lock()
+
 if not connection_string or not container_name:
     logger.error("Missing Azure Storage credentials")
     raise ValueError("Missing Azure Storage credentials")
 
+# Build the async blob client once so its HTTP session keeps connections warm across requests
+_blob_service_client = BlobServiceClient.from_connection_string(
+    connection_string, connection_timeout=10, read_timeout=60
+)
+_blob_client = _blob_service_client.get_container_client(container_name).get_blob_client(blob_name)
+
 # Security utilities
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 api_key_header = APIKeyHeader(name="X-API-Key")
 
@@ -62,11 +85,18 @@ class Token(BaseModel):
 class TokenData(BaseModel):
     username: Optional[str] = None
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+class ProjectModel(BaseModel):
+    """Project fields as sent by clients; aliases match the CSV column headers"""
+    model_config = ConfigDict(populate_by_name=True, extra="allow", coerce_numbers_to_str=True)
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    category: Optional[str] = Field(None, alias="Category")
+    project_name: Optional[str] = Field(None, alias="Project Name")
+    comments_due_date: Optional[str] = Field(None, alias="Comments Due Date")
+    submission_number: Optional[str] = Field(None, alias="Submission Number")
+    requirements: Optional[str] = Field(None, alias="Requirements")
+    submitted_requirements: Optional[str] = Field(None, alias="Submitted Requirements")
+    trc_reviewers: Optional[str] = Field(None, alias="TRC Reviewers")
+    reviewed_trc_departments: Optional[str] = Field(None, alias="Reviewed TRC Departments")
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
@@ -84,6 +114,15 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> str:
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    cached = _token_cache.get(key)
+    if cached is not None:
+        username, expires_at = cached
+        # Never serve a cached token past its own expiry
+        if time.time() < expires_at:
+            return username
+        _token_cache.pop(key, None)
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         username: str = payload.get("sub")
@@ -92,6 +131,9 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> str:
         token_data = TokenData(username=username)
     except JWTError:
         raise credentials_exception
+
+    expires_at = min(time.time() + TOKEN_CACHE_TTL_SECONDS, payload.get("exp", 0))
+    _token_cache[key] = (token_data.username, expires_at)
     return token_data.username
 
 async def verify_api_key(api_key: str = Security(api_key_header)) -> str:
@@ -99,62 +141,271 @@ async def verify_api_key(api_key: str = Security(api_key_header)) -> str:
         raise HTTPException(status_code=403, detail="Invalid API key")
     return api_key
 
+class RateLimiter:
+    """Sliding-window rate limit per client address, used as a route dependency
+
+    Route dependencies run before the endpoint's own, so requests are counted before authentication
+    and unauthenticated clients are throttled too.
+    """
+    PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+    def __init__(self, limit: str):
+        # Parse the limit once, e.g. "5/minute"
+        count, period = limit.split("/")
+        self.limit = limit
+        self.max_requests = int(count)
+        self.window = self.PERIODS[period]
+        # Clients idle for a whole window have nothing left to count, so their entries expire
+        self.hits: TTLCache = TTLCache(maxsize=10_000, ttl=self.window)
+
+    async def __call__(self, request: Request):
+        now = time.monotonic()
+        key = request.client.host if request.client else "127.0.0.1"
+        hits = self.hits.get(key)
+        if hits is None:
+            hits = deque()
+
+        # Drop requests that have left the window
+        while hits and now - hits[0] >= self.window:
+            hits.popleft()
+        self.hits[key] = hits
+
+        if len(hits) >= self.max_requests:
+            raise HTTPException(status_code=429, detail=f"Rate limit exceeded: {self.limit}")
+        hits.append(now)
+
 def get_blob_client():
-    """Get Azure Blob client for file operations"""
-    try:
-        blob_service_client = BlobServiceClient.from_connection_string(connection_string)
-        container_client = blob_service_client.get_container_client(container_name)
-        return container_client.get_blob_client(blob_name)
-    except Exception as e:
-        logger.error(f"Failed to connect to Azure Storage: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to connect to Azure Storage: {str(e)}")
+    """Get the shared Azure Blob client for file operations"""
+    return _blob_client
 
-def load_data() -> List[Dict[str, Any]]:
-    """Load and parse CSV data from Azure Storage"""
-    try:
-        blob_client = get_blob_client()
-        csv_data = blob_client.download_blob().readall().decode('utf-8')
-        
-        # Parse CSV data
-        reader = csv.DictReader(io.StringIO(csv_data))
-        projects = list(reader)
-        
-        # Clean up empty values
-        for project in projects:
-            for key, value in project.items():
-                if not value:
-                    project[key] = None
-        
-        logger.info(f"Loaded {len(projects)} projects")
-        return projects
-    except Exception as e:
-        logger.error(f"Failed to load data: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to load data: {str(e)}")
+def _invalidate_cache():
+    """Drop cached project rows so the next load refetches the blob"""
+    _cache.update(
+        etag=None, df=None, data=None, index={}, json=None, by_category_json={}, ts=0,
+        generation=_cache["generation"] + 1,
+    )
+
+def _build_index(projects: List[Dict[str, Any]]) -> Dict[Tuple[str, str], int]:
+    """Map (category, project name) to row position; first match wins"""
+    index = {}
+    for i, project in enumerate(projects):
+        index.setdefault((project['Category'], project['Project Name']), i)
+    return index
+
+def _build_cache_entry(etag: Optional[str], df: pd.DataFrame) -> Dict[str, Any]:
+    """Derive the cached views of a parsed project table stored under the given blob ETag"""
+    # Empty cells become None so the API keeps returning null for missing values
+    df = df.astype(object).where(df.notna(), None)
+    projects = df.to_dict(orient="records")
+
+    # Index rows by (category, project name) so lookups skip a full scan
+    index = _build_index(projects)
+    by_category = {category: group.to_dict(orient="records") for category, group in df.groupby('Category', sort=False)}
+
+    # Encode the project lists once per cache generation instead of once per request
+    return dict(
+        etag=etag,
+        df=df,
+        data=projects,
+        index=index,
+        json=orjson.dumps(projects),
+        by_category_json={category: orjson.dumps(rows) for category, rows in by_category.items()},
+        ts=time.monotonic(),
+    )
+
+def _populate_cache(etag: Optional[str], df: pd.DataFrame):
+    """Store a parsed project table as the newest cache generation"""
+    _cache.update(_build_cache_entry(etag, df), generation=_cache["generation"] + 1)
 
-def save_data(projects: List[Dict[str, Any]]):
-    """Save project data back to Azure Storage"""
+async def load_data() -> List[Dict[str, Any]]:
+    """Load and parse CSV data from Azure Storage, reusing the cached rows while the blob is unchanged"""
+    if _cache["data"] is not None and time.monotonic() - _cache["ts"] < CACHE_TTL_SECONDS:
+        return _cache["data"]
+
+    # Only one request reloads at a time; the others wait and reuse its result
+    async with _load_lock:
+        now = time.monotonic()
+        if _cache["data"] is not None and now - _cache["ts"] < CACHE_TTL_SECONDS:
+            return _cache["data"]
+        generation = _cache["generation"]
+
+        try:
+            blob_client = get_blob_client()
+
+            # Revalidate the cached rows with a cheap properties call before downloading
+            if _cache["data"] is not None:
+                etag = (await blob_client.get_blob_properties()).etag
+                if etag == _cache["etag"]:
+                    _cache["ts"] = now
+                    return _cache["data"]
+
+            downloader = await blob_client.download_blob()
+            etag = downloader.properties.etag
+            csv_data = await downloader.readall()
+
+            # Parse CSV data off the event loop, treating only empty cells as missing
+            df = await asyncio.to_thread(
+                pd.read_csv, io.BytesIO(csv_data), dtype=str, keep_default_na=False, na_values=[""]
+            )
+            entry = _build_cache_entry(etag, df)
+            logger.info(f"Loaded {len(df)} projects")
+        except Exception as e:
+            logger.error(f"Failed to load data: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Failed to load data: {str(e)}")
+
+        # A save may have cached newer rows while this download was in flight; never roll them back
+        if _cache["generation"] == generation:
+            _cache.update(entry, generation=generation + 1)
+        elif _cache["data"] is None:
+            # The cache was dropped meanwhile; keep these rows but make the next load revalidate them
+            _cache.update(entry, ts=0, generation=_cache["generation"] + 1)
+        return _cache["data"]
+
+async def find_project(category: str, project_name: str) -> Optional[int]:
+    """Return the position of a project in the cached rows, or None if it does not exist"""
+    await load_data()
+    return _cache["index"].get((category, project_name))
+
+async def save_data(projects: List[Dict[str, Any]], etag: str):
+    """Save project data back to Azure Storage if the blob still matches the ETag it was loaded from"""
     if not projects:
         return
         
     try:
-        # Write to CSV
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=projects[0].keys())
-        writer.writeheader()
-        writer.writerows(projects)
+        # Write to CSV off the event loop
+        df = pd.DataFrame.from_records(projects, columns=list(projects[0].keys()))
+        output = io.BytesIO()
+        await asyncio.to_thread(df.to_csv, output, index=False, encoding='utf-8')
+        output.seek(0)
         
-        # Upload to Azure
+        # Upload to Azure, failing instead of overwriting a concurrent change
         blob_client = get_blob_client()
-        blob_client.upload_blob(output.getvalue().encode('utf-8'), overwrite=True)
+        result = await blob_client.upload_blob(
+            output,
+            overwrite=True,
+            etag=etag,
+            match_condition=MatchConditions.IfNotModified,
+        )
+        _populate_cache(result.get("etag"), df)
+    except ResourceModifiedError:
+        raise
     except Exception as e:
+        _invalidate_cache()
         logger.error(f"Failed to save data: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to save data: {str(e)}")
 
+async def _flush_mutations(batch: List[Tuple[Callable, asyncio.Future]]):
+    """Apply a batch of mutations to the latest project rows and save them in a single upload
+
+    Each mutation receives the row list plus the (category, project name) index and returns the new
+    row list. It must replace rows rather than modify them, since the rows are shared with the cache.
+    If the blob changed since it was loaded, the whole batch is reapplied to the fresh rows.
+    """
+    outcomes = [None] * len(batch)
+    try:
+        for attempt in range(MAX_SAVE_ATTEMPTS):
+            projects = list(await load_data())
+            etag = _cache["etag"]
+            index = _cache["index"]
+            outcomes = []
+            for mutate, _ in batch:
+                try:
+                    projects = mutate(projects, index)
+                except Exception as e:
+                    outcomes.append(e)
+                    continue
+                outcomes.append(None)
+                # Deletes shift positions and renames move keys, so later mutations need a fresh index
+                index = _build_index(projects)
+
+            # Nothing to write if every mutation in the batch was rejected
+            if all(outcome is not None for outcome in outcomes):
+                break
+
+            try:
+                await save_data(projects, etag)
+                break
+            except ResourceModifiedError:
+                logger.warning(f"Project data changed during save (attempt {attempt + 1}), reloading")
+                _invalidate_cache()
+        else:
+            raise HTTPException(status_code=409, detail="Project data changed during save, please retry")
+    except Exception as e:
+        # Rejected mutations keep their own error; the failure applies to the ones that would have been saved
+        outcomes = [e if outcome is None else outcome for outcome in outcomes]
+
+    for (_, future), outcome in zip(batch, outcomes):
+        if future.done():
+            continue
+        if outcome is None:
+            future.set_result(None)
+        else:
+            future.set_exception(outcome)
+
+async def _flush_after_delay():
+    """Wait for more mutations to arrive, then write everything queued so far"""
+    global _flush_task
+    await asyncio.sleep(FLUSH_DELAY_SECONDS)
+    batch = _pending_mutations[:]
+    _pending_mutations.clear()
+    _flush_task = None
+    async with _write_lock:
+        await _flush_mutations(batch)
+
+async def apply_mutation(mutate: Callable[[List[Dict[str, Any]], Dict[Tuple[str, str], int]], List[Dict[str, Any]]]):
+    """Queue a mutation for the next batched save and wait until it has been written"""
+    global _flush_task
+    future = asyncio.get_running_loop().create_future()
+    _pending_mutations.append((mutate, future))
+    if _flush_task is None:
+        _flush_task = asyncio.create_task(_flush_after_delay())
+    await future
+
+def _validator_headers() -> Dict[str, str]:
+    """HTTP caching headers for GET responses, using the blob ETag as the validator"""
+    return {"ETag": _cache["etag"], "Cache-Control": CLIENT_CACHE_CONTROL}
+
+def _is_not_modified(request: Request) -> bool:
+    """Whether the client's If-None-Match already names the current blob ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match or _cache["etag"] is None:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or _cache["etag"] in tags
+
+def json_response(request: Request, content: Callable[[], bytes]) -> Response:
+    """Return 304 if the client's copy is current, otherwise the JSON body with validator headers"""
+    if _is_not_modified(request):
+        return Response(status_code=304, headers=_validator_headers())
+    return Response(content=content(), media_type="application/json", headers=_validator_headers())
+
+@app.on_event("startup")
+async def warm_cache():
+    """Load project data at startup so the first request does not pay for the blob download"""
+    try:
+        await load_data()
+    except HTTPException:
+        logger.warning("Could not warm the project cache at startup")
+
+@app.on_event("shutdown")
+async def close_blob_client():
+    """Close the shared blob client's HTTP session"""
+    await _blob_service_client.close()
+
 @app.post("/token", response_model=Token)
 async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends()):
     """Login endpoint to get access token"""
     # In production, verify against a database
-    if form_data.username != os.getenv("ADMIN_USERNAME") or form_data.password != os.getenv("ADMIN_PASSWORD"):
+    admin_username = os.getenv("ADMIN_USERNAME")
+    admin_password = os.getenv("ADMIN_PASSWORD")
+    if admin_username is None or admin_password is None:
+        valid = False
+    else:
+        # Compare both fields in constant time so response timing does not leak credentials
+        username_ok = hmac.compare_digest(form_data.username.encode(), admin_username.encode())
+        password_ok = hmac.compare_digest(form_data.password.encode(), admin_password.encode())
+        valid = username_ok and password_ok
+    if not valid:
         raise HTTPException(
             status_code=401,
             detail="Incorrect username or password",
@@ -171,87 +422,96 @@ async def read_root():
     """API health check endpoint"""
     return {"message": "Welcome to Cramerton Development Tracker API"}
 
-@app.get("/projects")
-@limiter.limit("5/minute")
+@app.get("/projects", dependencies=[Depends(RateLimiter("5/minute"))])
 async def get_projects(request: Request, current_user: str = Depends(get_current_user)):
     """Get all projects"""
     try:
-        projects = load_data()
-        return projects
+        await load_data()
+        return json_response(request, lambda: _cache["json"])
     except Exception as e:
         logger.error(f"Failed to get projects: {str(e)}")
         raise
 
-@app.get("/projects/{category}")
-@limiter.limit("5/minute")
+@app.get("/projects/{category}", dependencies=[Depends(RateLimiter("5/minute"))])
 async def get_projects_by_category(category: str, request: Request, current_user: str = Depends(get_current_user)):
     """Get projects filtered by category"""
-    projects = load_data()
-    return [p for p in projects if p['Category'] == category]
+    await load_data()
+    return json_response(request, lambda: _cache["by_category_json"].get(category, b"[]"))
 
-@app.get("/projects/{category}/{project_name}")
-@limiter.limit("5/minute")
+@app.get("/projects/{category}/{project_name}", dependencies=[Depends(RateLimiter("5/minute"))])
 async def get_project_details(category: str, project_name: str, request: Request, current_user: str = Depends(get_current_user)):
     """Get details for a specific project"""
-    projects = load_data()
-    project = next((p for p in projects if p['Category'] == category and p['Project Name'] == project_name), None)
+    project_index = await find_project(category, project_name)
     
-    if not project:
+    if project_index is None:
         raise HTTPException(status_code=404, detail="Project not found")
-    return project
+    return json_response(request, lambda: orjson.dumps(_cache["data"][project_index]))
 
-@app.put("/projects/{category}/{project_name}")
-@limiter.limit("3/minute")
-async def update_project(category: str, project_name: str, project_data: dict, request: Request, current_user: str = Depends(get_current_user)):
+@app.put("/projects/{category}/{project_name}", dependencies=[Depends(RateLimiter("3/minute"))])
+async def update_project(category: str, project_name: str, project_data: ProjectModel, request: Request, current_user: str = Depends(get_current_user)):
     """Update an existing project"""
-    try:
-        projects = load_data()
-        project_index = next((i for i, p in enumerate(projects) 
-                            if p['Category'] == category and p['Project Name'] == project_name), -1)
-        
-        if project_index == -1:
+    fields = project_data.model_dump(by_alias=True, exclude_unset=True)
+
+    def mutate(projects, index):
+        project_index = index.get((category, project_name))
+        if project_index is None:
             raise HTTPException(status_code=404, detail="Project not found")
         
         # Update only existing fields
-        for key, value in project_data.items():
-            if key in projects[project_index]:
-                projects[project_index][key] = value
-        
-        save_data(projects)
+        project = projects[project_index]
+        projects[project_index] = {**project, **{key: value for key, value in fields.items() if key in project}}
+        return projects
+
+    try:
+        await apply_mutation(mutate)
         return {"message": "Project updated successfully"}
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to update project: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to update project: {str(e)}")
 
-@app.post("/projects")
-@limiter.limit("3/minute")
-async def add_project(project_data: dict, request: Request, current_user: str = Depends(get_current_user)):
+@app.post("/projects", dependencies=[Depends(RateLimiter("3/minute"))])
+async def add_project(project_data: ProjectModel, request: Request, current_user: str = Depends(get_current_user)):
     """Add a new project"""
+    project = project_data.model_dump(by_alias=True)
+    provided = project_data.model_dump(by_alias=True, exclude_unset=True).keys()
+
+    def mutate(projects, index):
+        # Saving writes only the existing CSV columns, so refuse fields that would be dropped
+        if projects:
+            unknown = sorted(set(provided) - set(projects[0].keys()))
+            if unknown:
+                raise HTTPException(status_code=422, detail=f"Unknown project fields: {', '.join(unknown)}")
+        projects.append(project)
+        return projects
+
     try:
-        projects = load_data()
-        projects.append(project_data)
-        save_data(projects)
+        await apply_mutation(mutate)
         return {"message": "Project added successfully"}
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to add project: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to add project: {str(e)}")
 
-@app.delete("/projects/{category}/{project_name}")
-@limiter.limit("3/minute")
+@app.delete("/projects/{category}/{project_name}", dependencies=[Depends(RateLimiter("3/minute"))])
 async def delete_project(category: str, project_name: str, request: Request, current_user: str = Depends(get_current_user)):
     """Delete a project"""
-    try:
-        projects = load_data()
-        original_count = len(projects)
-        
-        # Remove the project
-        projects = [p for p in projects if not (p['Category'] == category and p['Project Name'] == project_name)]
-        
-        if len(projects) == original_count:
+    def mutate(projects, index):
+        project_index = index.get((category, project_name))
+        if project_index is None:
             raise HTTPException(status_code=404, detail="Project not found")
         
-        save_data(projects)
+        # Remove the project
+        del projects[project_index]
+        return projects
+
+    try:
+        await apply_mutation(mutate)
         return {"message": "Project deleted successfully"}
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to delete project: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to delete project: {str(e)}")
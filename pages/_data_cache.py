@@ -0,0 +1,24 @@
+import threading
+import time
+import pandas as pd
+from data import load_data
+
+# Shared project data for all pages, loaded once and refreshed after the TTL
+CACHE_TTL_SECONDS = 30
+
+_lock = threading.RLock()
+_cache = {"df": None, "ts": 0}
+
+def get_df():
+    """Return the shared project DataFrame, loading it on first use or once the TTL expires"""
+    with _lock:
+        now = time.monotonic()
+        if _cache["df"] is None or now - _cache["ts"] >= CACHE_TTL_SECONDS:
+            df = load_data()
+
+            # Convert 'Comments Due Date' to datetime once for every page, handling NaN values
+            df["Comments Due Date"] = pd.to_datetime(df["Comments Due Date"], format="%m/%d/%Y", errors="coerce")
+            df["_due_str"] = df["Comments Due Date"].dt.strftime("%m/%d/%Y")
+
+            _cache.update(df=df, ts=now)
+        return _cache["df"]
@@ -1,56 +1,76 @@
 import dash
-from dash import html, dcc
+from dash import html, dcc, clientside_callback, Input, Output
 import dash_bootstrap_components as dbc
-import pandas as pd
+import json
 import urllib.parse  # Handles URL encoding
-from data import load_data
+from pages._data_cache import get_df
 
-df = load_data()  # Load CSV data
+# Define categories
+categories = ["Rezoning", "Preliminary Plat", "Construction Drawings", "Final Plat"]
 
-# Convert 'Comments Due Date' to datetime format, handling NaN values
-df["Comments Due Date"] = pd.to_datetime(df["Comments Due Date"], errors="coerce")
+# Button records are rebuilt only when the shared DataFrame changes
+_records_cache = {"source": None, "records": None}
 
-# Function to sort projects
-def sort_projects(df):
-    return df.sort_values(
-        by=["Comments Due Date", "Project Name"], 
-        ascending=[True, True], 
-        na_position="last"  # NaN dates will go to the bottom
+def build_project_records(df):
+    # Sort all projects once; NaN dates will go to the bottom
+    df = df.sort_values(
+        by=["Comments Due Date", "Project Name"],
+        ascending=[True, True],
+        na_position="last"
     )
 
-# Define categories
-categories = ["Rezoning", "Preliminary Plat", "Construction Drawings", "Final Plat"]
+    # Precompute button labels and URL-safe links for every project in one pass
+    df["_label"] = df["Project Name"] + "\n" + (
+        "Comments Due: " + df["_due_str"]
+    ).fillna("⏳ Awaiting Resubmittal")
+    df["_href"] = "/project/" + df["Project Name"].map(urllib.parse.quote)
 
-# Generate category boxes
-category_cards = []
-for category in categories:
-    projects = sort_projects(df[df["Category"] == category])  # Apply sorting
-
-    # Create project buttons within category (Encode project name for URL safety)
-    project_buttons = [
-        dbc.Button(
-            f"{row['Project Name']}\n{'Comments Due: ' + row['Comments Due Date'].strftime('%m/%d/%Y') if pd.notna(row['Comments Due Date']) else '⏳ Awaiting Resubmittal'}",
-            href=f"/project/{urllib.parse.quote(row['Project Name'])}",  # Ensure URL is safe
-            className="home-project-button",
-        ) for _, row in projects.iterrows()
-    ]
-
-    category_cards.append(
-        dbc.Col([
-            html.Div([
-                html.H4(category, className="home-category-title"),
-                html.Div(project_buttons, className="home-project-container")  # Scrollable project list
-            ], className="home-category-box"),
-        ], width=3)
-    )
+    # Flat records keep the payload small; the browser builds the buttons from them
+    return df[["Category", "Project Name", "_label", "_href"]].to_dict("records")
+
+# Build the category boxes in the browser from the stored project records
+clientside_callback(
+    """
+    function(projects) {
+        const categories = %s;
+        return categories.map(function(category) {
+            // Records arrive already sorted, so filtering keeps each category in order
+            const buttons = (projects || []).filter(p => p["Category"] === category).map(p => ({
+                type: "Button",
+                namespace: "dash_bootstrap_components",
+                props: {children: p["_label"], href: p["_href"], className: "home-project-button"}
+            }));
+            return {
+                type: "Col",
+                namespace: "dash_bootstrap_components",
+                props: {width: 3, children: {
+                    type: "Div",
+                    namespace: "dash_html_components",
+                    props: {className: "home-category-box", children: [
+                        {type: "H4", namespace: "dash_html_components", props: {children: category, className: "home-category-title"}},
+                        {type: "Div", namespace: "dash_html_components", props: {children: buttons, className: "home-project-container"}}
+                    ]}
+                }}
+            };
+        });
+    }
+    """ % json.dumps(categories),
+    Output("category-row", "children"),
+    Input("projects-store", "data"),
+)
 
 # Home Page Layout
-layout = html.Div([
-    html.Div([
-        html.H1("Welcome", className="welcome-text"),
-        html.H2("Cramerton Plan Review Tracker", className="tracker-text")
-    ], className="home-header-container"),
+def layout():
+    df = get_df()
+    if _records_cache["source"] is not df:
+        _records_cache.update(source=df, records=build_project_records(df))
 
-    dbc.Row(category_cards, className="category-row", justify="center")  # Ensure center alignment
-], className="home-page")  # 🔥 Ensure this page has the .home-page class
+    return html.Div([
+        html.Div([
+            html.H1("Welcome", className="welcome-text"),
+            html.H2("Cramerton Plan Review Tracker", className="tracker-text")
+        ], className="home-header-container"),
 
+        dcc.Store(id="projects-store", data=_records_cache["records"]),
+        dbc.Row(id="category-row", className="category-row", justify="center")  # Ensure center alignment
+    ], className="home-page")  # 🔥 Ensure this page has the .home-page class
@@ -2,14 +2,11 @@ import dash
 from dash import html
 import pandas as pd
 import urllib.parse  # Handles URL decoding
-from data import load_data
-
-df = load_data()
-
-# Ensure 'Comments Due Date' is converted to datetime (if it hasn't been already)
-df["Comments Due Date"] = pd.to_datetime(df["Comments Due Date"], errors="coerce")
+from pages._data_cache import get_df
 
 def layout(project_name):
+    df = get_df()
+
     # Decode URL to handle spaces and special characters
     decoded_name = urllib.parse.unquote(project_name).strip()
 
@@ -26,15 +23,10 @@ def layout(project_name):
     # Extract project data
     project_data = filtered_df.iloc[0]
 
-    # Ensure 'Comments Due Date' is a datetime before formatting
-    comments_due = project_data["Comments Due Date"]
+    # Due dates are parsed and formatted once by the shared data cache
+    comments_due = project_data["_due_str"]
     if pd.notna(comments_due):  # Check if not NaN
-        if isinstance(comments_due, str):  # Convert to datetime if still a string
-            comments_due = pd.to_datetime(comments_due, errors="coerce")
-        if pd.notna(comments_due):  # If conversion was successful
-            status_text = f"📅 Comments Due: {comments_due.strftime('%m/%d/%Y')}"
-        else:
-            status_text = "⏳ Awaiting Resubmittal"
+        status_text = f"📅 Comments Due: {comments_due}"
     else:
         status_text = "⏳ Awaiting Resubmittal"
 
@@ -42,14 +34,14 @@ def layout(project_name):
     submission_number = f"📌 Submission #: {project_data['Submission Number']}" if pd.notna(project_data["Submission Number"]) else "N/A"
 
     # Process requirements
-    submitted_list = str(project_data["Submitted Requirements"]).split(", ") if pd.notna(project_data["Submitted Requirements"]) else []
+    submitted_set = set(str(project_data["Submitted Requirements"]).split(", ")) if pd.notna(project_data["Submitted Requirements"]) else set()
     all_items_list = str(project_data["Requirements"]).split(", ") if pd.notna(project_data["Requirements"]) else []
-    submittal_requirements = html.Ul([html.Li(f"{'✅' if item in submitted_list else '❌'} {item}") for item in all_items_list])
+    submittal_requirements = html.Ul([html.Li(f"{'✅' if item in submitted_set else '❌'} {item}") for item in all_items_list])
 
     # Process TRC Reviewers
-    reviewed_list = str(project_data["Reviewed TRC Departments"]).split(", ") if pd.notna(project_data["Reviewed TRC Departments"]) else []
+    reviewed_set = set(str(project_data["Reviewed TRC Departments"]).split(", ")) if pd.notna(project_data["Reviewed TRC Departments"]) else set()
     all_reviewers = str(project_data["TRC Reviewers"]).split(", ") if pd.notna(project_data["TRC Reviewers"]) else []
-    trc_reviewers = html.Ul([html.Li(f"{'✅' if reviewer in reviewed_list else '❌'} {reviewer}") for reviewer in all_reviewers])
+    trc_reviewers = html.Ul([html.Li(f"{'✅' if reviewer in reviewed_set else '❌'} {reviewer}") for reviewer in all_reviewers])
 
     return html.Div([
         html.Div([